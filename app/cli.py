@@ -0,0 +1,94 @@
+from sqlalchemy import inspect, select
+
+from app import db
+
+def register_cli(app):
+    """
+    Register the shell context and CLI commands on the application
+
+    Keeping the commands here (instead of in the entry-point script) means
+    every deployment shares one canonical implementation regardless of how
+    the app is launched.
+
+    Args:
+        app (Flask): Application to register the commands on
+    """
+
+    @app.shell_context_processor
+    def make_shell_context():
+        """
+        Add database and models to shell context for easy access in shell
+        """
+        from app.models.user import User
+        from app.models.network import NetworkInterface
+
+        return dict(db=db, User=User, NetworkInterface=NetworkInterface)
+
+    @app.cli.command("init-db")
+    def init_db():
+        """
+        Initialize the database with tables and initial data
+        """
+        from app.models.user import User
+
+        # Create only the tables that are missing; a single reflection here
+        # replaces create_all's per-table existence probes, and reruns of
+        # init-db skip DDL entirely
+        existing = set(inspect(db.engine).get_table_names())
+        missing = [t for t in db.metadata.sorted_tables if t.name not in existing]
+        if missing:
+            db.metadata.create_all(db.engine, tables=missing, checkfirst=False)
+
+        # Seed initial data inside a single explicit transaction
+        with db.session.begin():
+            created = db.session.scalar(select(User).where(User.username == 'admin')) is None
+            if created:
+                # Create admin user
+                admin = User(
+                    username='admin',
+                    email='admin@example.com',
+                    password='admin',
+                    is_admin=True
+                )
+                db.session.add(admin)
+
+        if created:
+            print('Admin user created.')
+        else:
+            print('Admin user already exists.')
+
+        print('Database initialized.')
+
+    @app.cli.command("create-user")
+    def create_user():
+        """
+        Create a new user interactively
+        """
+        import getpass
+
+        from app.models.user import User
+
+        username = input("Username: ")
+        email = input("Email: ")
+        password = getpass.getpass("Password: ")
+        is_admin = input("Admin (y/n): ").lower() == 'y'
+
+        # Check if user exists
+        if db.session.scalar(select(User).where(User.username == username)) is not None:
+            print(f"User '{username}' already exists.")
+            return
+
+        if db.session.scalar(select(User).where(User.email == email)) is not None:
+            print(f"Email '{email}' already in use.")
+            return
+
+        # Create user
+        user = User(
+            username=username,
+            email=email,
+            password=password,
+            is_admin=is_admin
+        )
+        db.session.add(user)
+        db.session.commit()
+        print(f"User '{username}' created successfully.")
@@ -5,6 +5,15 @@ class Config:
     """Base configuration class"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'hard-to-guess-string'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Pool sizing for multi-threaded Gunicorn workers; pre-ping discards
+    # stale connections before handing them to a request
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_timeout': 30,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800
+    }
     PERMANENT_SESSION_LIFETIME = timedelta(hours=1)
     USE_CDN = False  # Default to not using CDN
 
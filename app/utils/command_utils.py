@@ -1,6 +1,7 @@
+import functools
 import subprocess
 import shlex
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, Dict, Any
 
 # Define allowed commands
 ALLOWED_COMMANDS = {
@@ -104,6 +105,22 @@ def validate_command_args(command: str, args: str) -> bool:
     
     return True
 
+@functools.lru_cache(maxsize=256)
+def _split_command(cmd: str) -> Tuple[str, ...]:
+    """
+    Split a command line into arguments, caching the result
+
+    Repeated commands (e.g. periodic connectivity checks) reuse the
+    cached split instead of re-parsing the command line each time.
+
+    Args:
+        cmd (str): Full command line to split
+
+    Returns:
+        Tuple[str, ...]: Command arguments
+    """
+    return tuple(shlex.split(cmd))
+
 def execute_command(command: str, args: str = '') -> Tuple[str, int]:
     """
     Execute a command with arguments
@@ -128,7 +145,7 @@ def execute_command(command: str, args: str = '') -> Tuple[str, int]:
     
     # Prepare the command
     cmd = f"{command} {args}".strip()
-    cmd_args = shlex.split(cmd)
+    cmd_args = list(_split_command(cmd))
     
     try:
         # Execute the command
@@ -1,9 +1,55 @@
+import logging
 import subprocess
-import re
-import socket
+import time
 import netifaces
 import ipaddress
-from typing import Dict, Any, Tuple, List, Optional
+from pyroute2 import IPRoute
+from typing import Dict, Any, Tuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Prefix lengths for all legal IPv4 netmasks, precomputed so the common case
+# avoids constructing an IPv4Network object per lookup
+_NETMASK_TO_PREFIX = {
+    str(ipaddress.IPv4Network(f'0.0.0.0/{i}').netmask): i for i in range(33)
+}
+
+# Cache for /proc/net/dev statistics: (timestamp, {interface: counters})
+_proc_net_dev_cache: Tuple[float, Dict[str, Tuple[int, ...]]] = (0.0, {})
+_PROC_NET_DEV_TTL = 0.5  # seconds
+
+def _read_proc_net_dev() -> Dict[str, Tuple[int, ...]]:
+    """
+    Read per-interface statistics from /proc/net/dev in a single call
+
+    Reading /proc/net/dev once replaces the six separate sysfs reads
+    previously needed per interface. The parsed result is cached briefly
+    so concurrent status queries share one read.
+
+    Returns:
+        Dict[str, Tuple[int, ...]]: Mapping of interface name to the 16
+        counter columns (rx bytes/packets/errs/... then tx bytes/packets/errs/...)
+    """
+    global _proc_net_dev_cache
+
+    cached_at, stats = _proc_net_dev_cache
+    now = time.monotonic()
+    if now - cached_at < _PROC_NET_DEV_TTL and stats:
+        return stats
+
+    stats = {}
+    with open('/proc/net/dev', 'r') as f:
+        # Skip the two header lines
+        lines = f.readlines()[2:]
+
+    for line in lines:
+        iface, _, counters = line.partition(':')
+        if not counters:
+            continue
+        stats[iface.strip()] = tuple(int(v) for v in counters.split())
+
+    _proc_net_dev_cache = (now, stats)
+    return stats
 
 def get_interfaces() -> Dict[str, Dict[str, Any]]:
     """
@@ -17,7 +63,14 @@ def get_interfaces() -> Dict[str, Dict[str, Any]]:
     try:
         # Get all interface names
         iface_names = netifaces.interfaces()
-        
+
+        # Get gateway info once for all interfaces
+        gws = netifaces.gateways()
+        default_gw = None
+        default_gw_iface = None
+        if 'default' in gws and netifaces.AF_INET in gws['default']:
+            default_gw, default_gw_iface = gws['default'][netifaces.AF_INET][:2]
+
         for iface in iface_names:
             # Skip loopback interface
             if iface == 'lo':
@@ -41,15 +94,7 @@ def get_interfaces() -> Dict[str, Dict[str, Any]]:
                 iface_info['is_dhcp'] = True
             
             # Get gateway info
-            gws = netifaces.gateways()
-            if 'default' in gws and netifaces.AF_INET in gws['default']:
-                gw_info = gws['default'][netifaces.AF_INET]
-                if gw_info[1] == iface:
-                    iface_info['gateway'] = gw_info[0]
-                else:
-                    iface_info['gateway'] = None
-            else:
-                iface_info['gateway'] = None
+            iface_info['gateway'] = default_gw if default_gw_iface == iface else None
             
             # Get DNS servers (simplified - in real implementation we would parse /etc/resolv.conf)
             iface_info['dns_servers'] = "8.8.8.8,8.8.4.4"
@@ -60,8 +105,8 @@ def get_interfaces() -> Dict[str, Dict[str, Any]]:
             interfaces[iface] = iface_info
             
         return interfaces
-    except Exception as e:
-        print(f"Error getting interfaces: {str(e)}")
+    except Exception:
+        logger.exception("Error getting interfaces")
         return {}
 
 def is_interface_up(interface: str) -> bool:
@@ -75,16 +120,9 @@ def is_interface_up(interface: str) -> bool:
         bool: True if interface is up, False otherwise
     """
     try:
-        # Use subprocess to run ip link show
-        result = subprocess.run(
-            ['ip', 'link', 'show', interface],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        # Check if "UP" is in the output
-        return "UP" in result.stdout
+        # Read the interface operstate from sysfs (no subprocess needed)
+        with open(f'/sys/class/net/{interface}/operstate', 'r') as f:
+            return f.read().strip() == 'up'
     except Exception:
         return False
 
@@ -132,30 +170,18 @@ def get_interface_status(interface: str) -> Dict[str, Any]:
             if gw_info[1] == interface:
                 status['gateway'] = gw_info[0]
         
-        # Get statistics
-        with open(f'/sys/class/net/{interface}/statistics/rx_bytes', 'r') as f:
-            status['rx_bytes'] = int(f.read().strip())
-        
-        with open(f'/sys/class/net/{interface}/statistics/tx_bytes', 'r') as f:
-            status['tx_bytes'] = int(f.read().strip())
-        
-        with open(f'/sys/class/net/{interface}/statistics/rx_packets', 'r') as f:
-            status['rx_packets'] = int(f.read().strip())
-        
-        with open(f'/sys/class/net/{interface}/statistics/tx_packets', 'r') as f:
-            status['tx_packets'] = int(f.read().strip())
-        
-        with open(f'/sys/class/net/{interface}/statistics/rx_errors', 'r') as f:
-            rx_errors = int(f.read().strip())
-        
-        with open(f'/sys/class/net/{interface}/statistics/tx_errors', 'r') as f:
-            tx_errors = int(f.read().strip())
-        
-        status['errors'] = rx_errors + tx_errors
+        # Get statistics from /proc/net/dev (one read covers all counters)
+        counters = _read_proc_net_dev().get(interface)
+        if counters:
+            status['rx_bytes'] = counters[0]
+            status['rx_packets'] = counters[1]
+            status['tx_bytes'] = counters[8]
+            status['tx_packets'] = counters[9]
+            status['errors'] = counters[2] + counters[10]
         
         return status
-    except Exception as e:
-        print(f"Error getting interface status: {str(e)}")
+    except Exception:
+        logger.exception("Error getting status for interface %s", interface)
         return status
 
 def configure_interface(interface: str, is_dhcp: bool = True, ip_address: Optional[str] = None,
@@ -177,50 +203,52 @@ def configure_interface(interface: str, is_dhcp: bool = True, ip_address: Option
         bool: True if configuration was successful, False otherwise
     """
     try:
-        # Set interface up or down
-        if is_active:
-            subprocess.run(['ip', 'link', 'set', interface, 'up'], check=True)
-        else:
-            subprocess.run(['ip', 'link', 'set', interface, 'down'], check=True)
-            return True  # If we're setting the interface down, we're done
-        
-        # Configure IP address
-        if is_dhcp:
-            # Use DHCP (this is simplified - in a real implementation we would use dhclient)
-            subprocess.run(['dhclient', '-r', interface], check=True)
-            subprocess.run(['dhclient', interface], check=True)
-        else:
-            # Use static IP
-            if not ip_address or not netmask:
-                raise ValueError("IP address and netmask are required for static configuration")
-            
-            # Convert netmask to CIDR notation
-            netmask_cidr = ipaddress.IPv4Network(f'0.0.0.0/{netmask}').prefixlen
-            
-            # Remove any existing IP addresses
-            subprocess.run(['ip', 'addr', 'flush', 'dev', interface], check=True)
-            
-            # Add new IP address
-            subprocess.run(['ip', 'addr', 'add', f'{ip_address}/{netmask_cidr}', 'dev', interface], check=True)
-            
-            # Set default gateway if provided
-            if gateway:
-                # Remove existing default route
-                try:
-                    subprocess.run(['ip', 'route', 'del', 'default'], check=False)
-                except:
-                    pass
-                
-                # Add new default route
-                subprocess.run(['ip', 'route', 'add', 'default', 'via', gateway], check=True)
-            
-            # Configure DNS servers if provided (simplified - in real implementation we would update /etc/resolv.conf)
-            if dns_servers:
-                with open('/etc/resolv.conf', 'w') as f:
-                    for dns in dns_servers.split(','):
-                        f.write(f"nameserver {dns.strip()}\n")
-        
+        with IPRoute() as ipr:
+            links = ipr.link_lookup(ifname=interface)
+            if not links:
+                raise ValueError(f"Interface '{interface}' not found")
+            idx = links[0]
+
+            # Set interface up or down
+            if not is_active:
+                ipr.link('set', index=idx, state='down')
+                return True  # If we're setting the interface down, we're done
+            ipr.link('set', index=idx, state='up')
+
+            # Configure IP address
+            if is_dhcp:
+                # Release any existing lease, then renew in the background so
+                # we don't block on lease acquisition
+                subprocess.run(['dhclient', '-r', interface], check=False)
+                subprocess.Popen(['dhclient', interface])
+            else:
+                # Use static IP
+                if not ip_address or not netmask:
+                    raise ValueError("IP address and netmask are required for static configuration")
+
+                # Convert netmask to CIDR notation
+                netmask_cidr = _NETMASK_TO_PREFIX.get(netmask)
+                if netmask_cidr is None:
+                    netmask_cidr = ipaddress.IPv4Network(f'0.0.0.0/{netmask}').prefixlen
+
+                # Remove any existing IP addresses
+                ipr.flush_addr(index=idx)
+
+                # Add new IP address
+                ipr.addr('add', index=idx, address=ip_address, prefixlen=netmask_cidr)
+
+                # Set default gateway if provided ('replace' swaps the existing
+                # default route atomically)
+                if gateway:
+                    ipr.route('replace', dst='default', gateway=gateway)
+
+                # Configure DNS servers if provided (simplified - in real implementation we would update /etc/resolv.conf)
+                if dns_servers:
+                    with open('/etc/resolv.conf', 'w') as f:
+                        for dns in dns_servers.split(','):
+                            f.write(f"nameserver {dns.strip()}\n")
+
         return True
-    except Exception as e:
-        print(f"Error configuring interface: {str(e)}")
+    except Exception:
+        logger.exception("Error configuring interface %s", interface)
         return False
\ No newline at end of file
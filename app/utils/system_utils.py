@@ -1,30 +1,42 @@
+import logging
 import os
 import subprocess
 import platform
 import psutil
-import shutil
+import time
 from typing import Dict, Any, List, Tuple
 
+logger = logging.getLogger(__name__)
+
+# Static system information that cannot change within a process lifetime,
+# gathered once at import instead of on every request
+_STATIC_INFO = {
+    'hostname': platform.node(),
+    'platform': platform.system(),
+    'platform_version': platform.version(),
+    'architecture': platform.machine(),
+    'processor': platform.processor(),
+    'python_version': platform.python_version()
+}
+
+# Prime the CPU sampler so non-blocking cpu_percent calls return real values
+psutil.cpu_percent(interval=None)
+
 def get_system_info() -> Dict[str, Any]:
     """
     Get system information
-    
+
     Returns:
         Dict[str, Any]: System information
     """
-    info = {
-        'hostname': platform.node(),
-        'platform': platform.system(),
-        'platform_version': platform.version(),
-        'architecture': platform.machine(),
-        'processor': platform.processor(),
-        'python_version': platform.python_version(),
+    info = dict(_STATIC_INFO)
+    info.update({
         'uptime': get_uptime(),
         'memory': get_memory_info(),
-        'cpu_usage': psutil.cpu_percent(interval=1),
+        'cpu_usage': psutil.cpu_percent(interval=None),
         'load_average': get_load_average()
-    }
-    
+    })
+
     return info
 
 def get_uptime() -> str:
@@ -50,8 +62,8 @@ def get_uptime() -> str:
             return f"{int(minutes)}m {int(seconds)}s"
         else:
             return f"{int(seconds)}s"
-    except Exception as e:
-        print(f"Error getting uptime: {str(e)}")
+    except Exception:
+        logger.exception("Error getting uptime")
         return "Unknown"
 
 def get_memory_info() -> Dict[str, Any]:
@@ -79,10 +91,19 @@ def get_load_average() -> List[float]:
     """
     try:
         return os.getloadavg()
-    except Exception as e:
-        print(f"Error getting load average: {str(e)}")
+    except Exception:
+        logger.exception("Error getting load average")
         return [0.0, 0.0, 0.0]
 
+# Pseudo filesystems to exclude from disk usage reporting. Note that
+# 'overlay' stays visible: the device root is an overlayfs and hiding it
+# would drop the main disk from the dashboard.
+_VIRTUAL_FS = {'tmpfs', 'devtmpfs', 'proc', 'sysfs', 'cgroup', 'cgroup2', 'squashfs'}
+
+# Cache for disk usage results: (timestamp, result)
+_disk_usage_cache: Tuple[float, Dict[str, Dict[str, Any]]] = (0.0, {})
+_DISK_USAGE_TTL = 5.0  # seconds
+
 def get_disk_usage() -> Dict[str, Dict[str, Any]]:
     """
     Get disk usage information
@@ -90,12 +111,23 @@ def get_disk_usage() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict[str, Dict[str, Any]]: Disk usage information
     """
+    global _disk_usage_cache
+
+    cached_at, disk_info = _disk_usage_cache
+    now = time.monotonic()
+    if now - cached_at < _DISK_USAGE_TTL and disk_info:
+        return disk_info
+
     disk_info = {}
-    
+
     for partition in psutil.disk_partitions():
+        # Skip pseudo filesystems - they carry no useful usage information
+        if partition.fstype in _VIRTUAL_FS:
+            continue
+
         try:
             usage = psutil.disk_usage(partition.mountpoint)
-            
+
             disk_info[partition.mountpoint] = {
                 'device': partition.device,
                 'fstype': partition.fstype,
@@ -104,27 +136,31 @@ def get_disk_usage() -> Dict[str, Dict[str, Any]]:
                 'free': format_bytes(usage.free),
                 'percent': usage.percent
             }
-        except Exception as e:
-            print(f"Error getting disk usage for {partition.mountpoint}: {str(e)}")
-    
+        except Exception:
+            logger.exception("Error getting disk usage for %s", partition.mountpoint)
+
+    _disk_usage_cache = (now, disk_info)
     return disk_info
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_bytes(bytes: int) -> str:
     """
     Format bytes to human-readable format
-    
+
     Args:
         bytes (int): Bytes to format
-        
+
     Returns:
         str: Formatted string
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes < 1024:
-            return f"{bytes:.2f} {unit}"
-        bytes /= 1024
-    
-    return f"{bytes:.2f} PB"
+    bytes = int(bytes)
+    if bytes < 1024:
+        return f"{bytes:.2f} B"
+
+    # Pick the unit in O(1) from the bit length instead of dividing in a loop
+    unit_idx = min((bytes.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes / (1 << (unit_idx * 10)):.2f} {_BYTE_UNITS[unit_idx]}"
 
 def perform_system_reset() -> None:
     """
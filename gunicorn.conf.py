@@ -1,18 +1,37 @@
 # Gunicorn configuration file for production deployment
 
+import gc
+
 # Server socket
 bind = '0.0.0.0:8000'
 
 # Worker processes
-workers = 4  # Recommended: 2-4 x $(NUM_CORES)
-worker_class = 'sync'
-worker_connections = 1000
+# gthread serves I/O-bound requests (DB queries, subprocess calls) from a
+# thread pool, so concurrency is workers x threads at roughly the RAM cost
+# of the workers alone - a better fit for this 1GB-class device than sync.
+workers = 2
+worker_class = 'gthread'
+threads = 4
 timeout = 30
 keepalive = 2
 
+# Recycle workers periodically to keep memory usage bounded; jitter avoids
+# all workers restarting at once
+max_requests = 2000
+max_requests_jitter = 400
+
+# Load the application once in the master before forking so workers share
+# imported modules and bytecode via copy-on-write
+preload_app = True
+
+# Keep worker heartbeat files on tmpfs so the liveness check never touches
+# the (slow, flash-backed) disk
+worker_tmp_dir = '/dev/shm'
+
 # Server mechanics
+# Run in the foreground with no pidfile: the systemd unit (or container
+# runtime) supervises the master process directly
 daemon = False
-pidfile = '/var/run/miniman/gunicorn.pid'
 umask = 0o007
 user = None
 group = None
@@ -44,6 +63,12 @@ def when_ready(server):
     """
     Called just after the server is started.
     """
+    # Move everything loaded by preload_app into the permanent GC generation
+    # so the collector never touches (and thereby dirties) those shared pages
+    # in the workers - keeps the copy-on-write savings intact.
+    gc.collect()
+    gc.freeze()
+
     print("Gunicorn server is ready. Application startup complete.")
 
 def worker_int(worker):
@@ -64,6 +89,15 @@ def post_fork(server, worker):
     """
     server.log.info("Worker spawned (pid: %s)", worker.pid)
 
+    # With preload_app the connection pool is created in the master; each
+    # worker must dispose it and build its own so connections are not
+    # shared across processes.
+    from run import app
+    from app import db
+
+    with app.app_context():
+        db.engine.dispose()
+
 def pre_fork(server, worker):
     """
     Called just prior to forking the worker subprocess.
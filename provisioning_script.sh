@@ -356,7 +356,7 @@ User=www-data
 WorkingDirectory=/opt/miniman
 RuntimeDirectory=miniman
 # Add runtime directory settings to avoid permission issues
-ExecStart=/opt/miniman/venv/bin/gunicorn -w 4 -b 0.0.0.0:8000 --pid /var/run/miniman/gunicorn.pid --worker-tmp-dir /var/run/miniman "run:app"
+ExecStart=/opt/miniman/venv/bin/gunicorn -b 0.0.0.0:8000 "run:app"
 Restart=always
 RestartSec=5
 # Set environment variables for the application